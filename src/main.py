@@ -1,58 +1,115 @@
 import pandas as pd
-import json
+import orjson
 import numpy as np
+import contextlib
 import os
+import re
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
 
 MAX_POINTS_ON_GLOBE = 10000
+# Only these columns are referenced by clean_data/perform_eda/export_globe_data
+ANALYSIS_COLUMNS = ['datetime', 'duration_seconds', 'latitude', 'longitude', 'shape', 'country', 'state']
+# Standardized header names accepted at load time (includes raw duration variants renamed later)
+LOAD_COLUMNS = set(ANALYSIS_COLUMNS) | {'durationseconds', 'durationseconds_1'}
+# Parquet schema metadata key recording the projection a cache was built with
+CACHE_COLUMNS_KEY = b'ufo_analysis_columns'
+
+def standardize_column_name(name):
+    """Lowercases, strips and removes non-alphanumeric characters from a column name."""
+    return re.sub('[^A-Za-z0-9_]+', '', name.lower().strip())
+
+def fast_median(values):
+    """Median of the non-NaN values via quickselect (np.partition), or None if there are none."""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    n = values.size
+    if n == 0:
+        return None
+    k = n // 2
+    if n % 2:
+        return float(np.partition(values, k)[k])
+    lower, upper = np.partition(values, [k - 1, k])[k - 1:k + 1]
+    return float((lower + upper) / 2)
+
+def bincount_series(values):
+    """Counts of each integer value as a Series indexed by value in ascending order, omitting zero counts."""
+    values = np.asarray(values, dtype=np.int64)
+    if values.size == 0:
+        return pd.Series(dtype='int64')
+    offset = values.min()
+    counts = np.bincount(values - offset) # Small bounded ranges (years, months, hours): no hashing needed
+    present = np.flatnonzero(counts)
+    return pd.Series(counts[present], index=present + offset)
+
+def ranked_value_counts(values):
+    """Counts of each distinct value, most frequent first, with ties kept in order of first appearance.
+
+    Categorical value_counts breaks ties by category (alphabetical) order; this keeps the
+    first-appearance tie order that value_counts gives on plain string columns.
+    """
+    codes, uniques = pd.factorize(values) # Codes are numbered in order of first appearance; missing values are -1
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    order = np.argsort(-counts, kind='stable')
+    return pd.Series(counts[order], index=uniques[order])
+
+def rank_counts(counts, first_seen):
+    """Sorts counts descending, breaking ties by earliest first-seen row position."""
+    order = np.lexsort((first_seen.to_numpy(dtype=np.float64), -counts.to_numpy()))
+    return counts.iloc[order]
 
 def clean_data(df):
     """Cleans the UFO sightings dataframe."""
-    # Convert datetime column to datetime objects, coercing errors
-    df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce')
+    # Convert datetime column to datetime objects, coercing errors.
+    # The scrubbed NUFORC data uses ISO timestamps (YYYY-MM-DD HH:MM:SS); an explicit format keeps
+    # pandas on its C parser instead of per-string inference. Columns already parsed by Arrow pass through.
+    # assign/dropna return new frames, so the caller's raw frame is never mutated and needs no defensive copy.
+    df = df.assign(datetime=pd.to_datetime(df['datetime'], format='ISO8601', errors='coerce', cache=True))
 
     # Drop rows where datetime conversion failed
-    df.dropna(subset=['datetime'], inplace=True)
+    df = df.dropna(subset=['datetime'])
 
-    # Extract year, month, hour
-    df['year'] = df['datetime'].dt.year
-    df['month'] = df['datetime'].dt.month
-    df['hour'] = df['datetime'].dt.hour
+    # Extract year, month, hour through one accessor, downcast to the smallest ints that hold them
+    dt = df['datetime'].dt
+    df['year'] = dt.year.astype('int16')
+    df['month'] = dt.month.astype('int8')
+    df['hour'] = dt.hour.astype('int8')
 
     # Clean numeric columns: duration (seconds), latitude, longitude
     df['duration_seconds'] = pd.to_numeric(df['duration_seconds'], errors='coerce')
-    
-    # --- Added: Filter out extremely long or zero durations for more meaningful stats ---
-    # Cap at 1 week (604800s) for sanity, ensure positive duration
-    df = df[(df['duration_seconds'] > 0) & (df['duration_seconds'] < 604800)] 
-
-
     df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
     df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
 
-    # Handle missing or problematic geographic data
-    # Also ensure duration_seconds is not NaN after its cleaning, as it's now more critical
-    df.dropna(subset=['latitude', 'longitude', 'duration_seconds'], inplace=True)
-    df = df[(df['latitude'] >= -90) & (df['latitude'] <= 90)]
-    df = df[(df['longitude'] >= -180) & (df['longitude'] <= 180)]
-
+    # Fused row filter: one mask, one gather. NaNs compare False, so missing values drop out too.
+    # Durations are capped at 1 week (604800s) for sanity and must be positive;
+    # coordinates must fall within valid latitude/longitude ranges.
+    duration = df['duration_seconds'].to_numpy(dtype=np.float64, na_value=np.nan)
+    lat = df['latitude'].to_numpy(dtype=np.float64, na_value=np.nan)
+    lng = df['longitude'].to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = ((duration > 0) & (duration < 604800)
+            & (lat >= -90) & (lat <= 90)
+            & (lng >= -180) & (lng <= 180))
+    df = df.loc[mask]
+
+    # Normalize each string column in one chain over Arrow-backed strings; missing values stay <NA>
     if 'shape' in df.columns:
-        df['shape'] = df['shape'].astype(str).str.lower().str.strip()
-        # Consolidate various forms of unknown/other
-        df['shape'].replace(['unknown', 'other', 'nan', '', 'na', 'unspecified'], 'various', inplace=True)
-        df['shape'] = df['shape'].fillna('various') # Ensure no NaNs in shape after cleaning
+        shape = df['shape'].astype('string[pyarrow]').str.lower().str.strip()
+        # Consolidate various forms of unknown/other, and missing shapes, with one hash-set lookup per row
+        is_various = shape.isin(['unknown', 'other', 'nan', '', 'na', 'unspecified']) | shape.isna()
+        df['shape'] = shape.mask(is_various, 'various').astype('category') # Low cardinality: compare and group on int codes
 
     if 'country' in df.columns:
-        df['country'] = df['country'].astype(str).str.lower().str.strip()
-        df.loc[df['country'] == 'gb', 'country'] = 'uk'
-        df.loc[df['country'] == '', 'country'] = 'unknown' # Handle empty strings
-        df['country'] = df['country'].fillna('unknown')
-
+        df['country'] = (df['country'].astype('string[pyarrow]').str.lower().str.strip()
+                         .replace({'gb': 'uk', '': 'unknown'}) # Handle empty strings
+                         .fillna('unknown')
+                         .astype('category'))
 
     if 'state' in df.columns:
-        df['state'] = df['state'].astype(str).str.upper().str.strip()
-        df.loc[df['state'] == '', 'state'] = 'UNKNOWN' # Handle empty strings
-        df['state'] = df['state'].fillna('UNKNOWN')
-
+        df['state'] = (df['state'].astype('string[pyarrow]').str.upper().str.strip()
+                       .replace({'': 'UNKNOWN'}) # Handle empty strings
+                       .fillna('UNKNOWN')
+                       .astype('category'))
 
     return df
 
@@ -62,33 +119,42 @@ def perform_eda(df):
     print(f"\nTotal cleaned sightings suitable for analysis: {len(df)}")
 
     # --- Basic EDA ---
-    median_duration_overall = df['duration_seconds'].median() if 'duration_seconds' in df and not df['duration_seconds'].empty else None
+    median_duration_overall = fast_median(df['duration_seconds'].to_numpy(dtype=np.float64, na_value=np.nan)) if 'duration_seconds' in df else None
     if median_duration_overall is not None:
         print(f"Overall median sighting duration: {median_duration_overall:.2f} seconds")
     else:
         print("Overall median sighting duration: Not available")
 
-    sightings_by_year = df['year'].value_counts().sort_index()
+    sightings_by_year = bincount_series(df['year'].to_numpy())
     # Using pandas to generate month names for robustness
     month_map = {i: pd.Timestamp(f'2000-{i}-01').strftime('%b') for i in range(1, 13)}
-    sightings_by_month_named = df['month'].value_counts().sort_index().rename(index=month_map)
+    sightings_by_month_named = bincount_series(df['month'].to_numpy()).rename(index=month_map)
     
     peak_month_name = sightings_by_month_named.idxmax() if not sightings_by_month_named.empty else "N/A"
     print(f"Peak sighting month: {peak_month_name}")
 
-    sightings_by_hour = df['hour'].value_counts().sort_index()
+    hours = df['hour'].to_numpy() # Fetched once; reused for the night/day split below
+    sightings_by_hour = bincount_series(hours)
     peak_hour_numeric = sightings_by_hour.idxmax() if not sightings_by_hour.empty else None
     peak_hour_readable = f"{int(peak_hour_numeric)}:00 - {int(peak_hour_numeric)+1}:00" if peak_hour_numeric is not None else "N/A"
     print(f"Peak sighting hour (24h format): {peak_hour_readable}")
 
-    valid_countries = df[(df['country'].notna()) & (df['country'] != 'unknown')]['country']
-    top_countries = valid_countries.value_counts().nlargest(5) if not valid_countries.empty else pd.Series(dtype='int')
-
-    us_sightings = df[(df['country'] == 'us') & (df['state'].notna()) & (df['state'] != 'UNKNOWN')]
-    top_states_us = us_sightings['state'].value_counts().nlargest(5) if not us_sightings.empty else pd.Series(dtype='int')
-
-    valid_shapes_df = df[(df['shape'].notna()) & (df['shape'] != 'various')]
-    top_shapes_series = valid_shapes_df['shape'].value_counts().nlargest(10) if not valid_shapes_df.empty else pd.Series(dtype='int')
+    # Filter with boolean masks and pull only the columns each tally needs, never whole-row copies
+    valid_countries = df.loc[df['country'].notna() & (df['country'] != 'unknown'), 'country']
+    top_countries = ranked_value_counts(valid_countries).head(5) if not valid_countries.empty else pd.Series(dtype='int')
+
+    us_states = df.loc[(df['country'] == 'us') & df['state'].notna() & (df['state'] != 'UNKNOWN'), 'state']
+    top_states_us = ranked_value_counts(us_states).head(5) if not us_states.empty else pd.Series(dtype='int')
+
+    # One (hour, shape) tally serves both the overall top shapes and the peak-hour breakdown below.
+    # The first row position of each pair is tracked too, so tied counts keep first-appearance order.
+    row_positions = pd.Series(np.arange(len(df)), index=df.index)
+    hour_shape_stats = row_positions.groupby([df['hour'], df['shape']], observed=True).agg(['size', 'min'])
+    hour_shape_counts = hour_shape_stats['size'].unstack(fill_value=0)
+    hour_shape_first_seen = hour_shape_stats['min'].unstack()
+    shape_counts = hour_shape_counts.sum(axis=0).drop('various', errors='ignore')
+    shape_first_seen = hour_shape_first_seen.min(axis=0).reindex(shape_counts.index)
+    top_shapes_series = rank_counts(shape_counts, shape_first_seen).head(10)
     most_common_shape = top_shapes_series.index[0] if len(top_shapes_series) > 0 else "N/A"
     second_most_common_shape = top_shapes_series.index[1] if len(top_shapes_series) > 1 else "N/A"
     print(f"Most common reported shape (excluding 'various'): {most_common_shape}")
@@ -100,15 +166,18 @@ def perform_eda(df):
 
     # 1. Sighting Duration by UFO Shape (Top 5 shapes)
     durations_by_shape = {}
-    if not top_shapes_series.empty and 'duration_seconds' in valid_shapes_df.columns:
+    if not top_shapes_series.empty and 'duration_seconds' in df.columns:
         print("\nMedian Sighting Duration (seconds) by Top UFO Shapes:")
-        # Iterate over the top N shapes if available, ensuring the shape exists in valid_shapes_df
-        for shape in top_shapes_series.head(5).index: # Focus on top 5 for summary
-            shape_data = valid_shapes_df[valid_shapes_df['shape'] == shape]
-            if not shape_data.empty and not shape_data['duration_seconds'].dropna().empty:
-                median_dur = shape_data['duration_seconds'].median()
-                durations_by_shape[shape] = round(median_dur, 2) if pd.notna(median_dur) else None
-                print(f"  - {shape.capitalize()}: {durations_by_shape[shape] if durations_by_shape[shape] is not None else 'N/A'}")
+        # One grouped pass over the shape column instead of re-filtering per shape
+        valid_shape_mask = df['shape'].notna() & (df['shape'] != 'various')
+        valid_shapes = df.loc[valid_shape_mask, 'shape']
+        valid_shape_durations = df.loc[valid_shape_mask, 'duration_seconds']
+        median_by_shape = valid_shape_durations.groupby(valid_shapes, sort=False, observed=True).median()
+        median_by_shape = median_by_shape.reindex(top_shapes_series.head(5).index).round(2) # Focus on top 5 for summary
+        for shape, median_dur in median_by_shape.items():
+            if pd.notna(median_dur):
+                durations_by_shape[shape] = float(median_dur)
+                print(f"  - {shape.capitalize()}: {durations_by_shape[shape]}")
             else:
                 durations_by_shape[shape] = None # Store None if no valid duration data for this shape
                 print(f"  - {shape.capitalize()}: N/A (no duration data)")
@@ -117,10 +186,12 @@ def perform_eda(df):
     # 2. Shape Distribution During Peak Sighting Hour
     top_shapes_in_peak_hour_summary = "N/A"
     peak_hour_dominant_shape = "N/A"
-    if peak_hour_numeric is not None and not df[df['hour'] == peak_hour_numeric].empty:
-        peak_hour_sightings = df[(df['hour'] == peak_hour_numeric) & (df['shape'] != 'various') & (df['shape'].notna())]
-        if not peak_hour_sightings.empty:
-            peak_hour_shapes_dist = peak_hour_sightings['shape'].value_counts(normalize=True).nlargest(3) # Top 3
+    if peak_hour_numeric is not None and peak_hour_numeric in hour_shape_counts.index:
+        peak_hour_shape_counts = hour_shape_counts.loc[peak_hour_numeric].drop('various', errors='ignore')
+        peak_hour_shape_counts = peak_hour_shape_counts[peak_hour_shape_counts > 0]
+        if peak_hour_shape_counts.sum() > 0:
+            peak_hour_shape_counts = rank_counts(peak_hour_shape_counts, hour_shape_first_seen.loc[peak_hour_numeric, peak_hour_shape_counts.index])
+            peak_hour_shapes_dist = (peak_hour_shape_counts / peak_hour_shape_counts.sum()).head(3) # Top 3
             if not peak_hour_shapes_dist.empty:
                 peak_hour_dominant_shape = peak_hour_shapes_dist.index[0]
                 top_shapes_in_peak_hour_summary = ", ".join([f"{s.capitalize()} ({p*100:.1f}%)" for s, p in peak_hour_shapes_dist.items()])
@@ -134,14 +205,12 @@ def perform_eda(df):
 
 
     # 3. Sighting Duration: Night vs. Day
-    df_copy = df.copy()
-    df_copy['time_of_day'] = df_copy['hour'].apply(lambda h: 'Night (18:00-05:59)' if (18 <= h <= 23 or 0 <= h <= 5) else 'Day (06:00-17:59)')
-    
-    night_durations = df_copy[df_copy['time_of_day'] == 'Night (18:00-05:59)']['duration_seconds'].dropna()
-    day_durations = df_copy[df_copy['time_of_day'] == 'Day (06:00-17:59)']['duration_seconds'].dropna()
+    # Single vectorized comparison on the hour column; night spans 18:00-05:59
+    is_night = (hours >= 18) | (hours <= 5)
+    durations = df['duration_seconds'].to_numpy(dtype=np.float64, na_value=np.nan)
 
-    median_duration_night = night_durations.median() if not night_durations.empty else None
-    median_duration_day = day_durations.median() if not day_durations.empty else None
+    median_duration_night = fast_median(durations[is_night])
+    median_duration_day = fast_median(durations[~is_night])
     
     print("\nMedian Sighting Duration by Time of Day:")
     print(f"  - Night: {median_duration_night:.2f}s" if pd.notna(median_duration_night) else "  - Night: N/A")
@@ -151,10 +220,11 @@ def perform_eda(df):
     long_duration_threshold_sec = 300 # 5 minutes
     long_duration_threshold_sec_2 = 3600 # 1 hour
     
-    count_long_duration = len(df[df['duration_seconds'] > long_duration_threshold_sec])
-    proportion_long_duration = (count_long_duration / len(df)) * 100 if len(df) > 0 else 0
-    count_very_long_duration = len(df[df['duration_seconds'] > long_duration_threshold_sec_2])
-    proportion_very_long_duration = (count_very_long_duration / len(df)) * 100 if len(df) > 0 else 0
+    # Count straight off the duration array from section 3; no filtered frames needed
+    count_long_duration = int((durations > long_duration_threshold_sec).sum())
+    proportion_long_duration = (count_long_duration / durations.size) * 100 if durations.size > 0 else 0
+    count_very_long_duration = int((durations > long_duration_threshold_sec_2).sum())
+    proportion_very_long_duration = (count_very_long_duration / durations.size) * 100 if durations.size > 0 else 0
 
     print(f"\nProportion of sightings lasting over 5 minutes ({long_duration_threshold_sec}s): {proportion_long_duration:.2f}%")
     print(f"Proportion of sightings lasting over 1 hour ({long_duration_threshold_sec_2}s): {proportion_very_long_duration:.2f}%")
@@ -194,51 +264,46 @@ def export_globe_data(df, filename="data/sightings_for_globe.json"):
         print("DataFrame is empty, cannot export globe data.")
         # Create an empty file or a file with an empty list
         os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, 'w') as f:
-            json.dump([], f)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps([]))
         print(f"Empty globe data file created at {filename}")
         return
 
     if len(df) > MAX_POINTS_ON_GLOBE:
         print(f"Sampling down to {MAX_POINTS_ON_GLOBE} points from {len(df)} for globe visualization.")
-        globe_df = df.sample(n=MAX_POINTS_ON_GLOBE, random_state=42).copy()
+        globe_df = df.sample(n=MAX_POINTS_ON_GLOBE, random_state=42) # sample already returns a new frame
     else:
-        globe_df = df.copy()
+        globe_df = df
 
     if 'duration_seconds' in globe_df.columns and not globe_df['duration_seconds'].dropna().empty:
         min_duration, max_duration_cap = 1.0, 3600.0 * 24 # Cap at 1 day for visualization scaling
-        globe_df.loc[:, 'positive_duration'] = globe_df['duration_seconds'].clip(lower=1e-6) # Should be positive from clean_data
-        globe_df.loc[:, 'normalized_duration'] = globe_df['positive_duration'].clip(min_duration, max_duration_cap)
-        
         log_min_duration = np.log(min_duration)
         log_max_duration_cap = np.log(max_duration_cap) # Max for normalization, not necessarily data max
-        
-        if log_max_duration_cap > log_min_duration:
-            # Normalize against the capped max duration for consistent scaling
-            log_norm_duration = (np.log(globe_df['normalized_duration']) - log_min_duration) / \
-                                (log_max_duration_cap - log_min_duration)
-        else: 
-            log_norm_duration = 0.1 
-            
-        globe_df.loc[:, 'magnitude'] = 0.03 + (log_norm_duration * 0.25) # Adjusted magnitude range slightly
-        globe_df['magnitude'] = globe_df['magnitude'].fillna(0.03) # Default to min magnitude
+
+        # Whole pipeline on one NumPy array: clip, log-normalize against the capped max, scale
+        durations = np.clip(globe_df['duration_seconds'].to_numpy(dtype=np.float64, na_value=np.nan), min_duration, max_duration_cap)
+        log_norm_duration = (np.log(durations) - log_min_duration) / (log_max_duration_cap - log_min_duration)
+        magnitude = 0.03 + (log_norm_duration * 0.25) # Adjusted magnitude range slightly
+        magnitude = np.where(np.isnan(magnitude), 0.03, magnitude) # Default to min magnitude
     else:
-        globe_df['magnitude'] = 0.03 
-
-    output_data = []
-    for _, row in globe_df.iterrows():
-        output_data.append({
-            "lat": row['latitude'],
-            "lng": row['longitude'],
-            "alt": 0.005, 
-            "radius": max(0.01, row.get('magnitude', 0.03)), # Ensure a minimum visible radius
-            "color": "rgba(255, 255, 0, 0.7)" 
-        })
-    
+        magnitude = np.full(len(globe_df), 0.03)
+
+    # Pull whole columns out once rather than boxing every row into a Series
+    latitudes = globe_df['latitude'].to_numpy(dtype=np.float64)
+    longitudes = globe_df['longitude'].to_numpy(dtype=np.float64)
+    radii = np.maximum(0.01, magnitude) # Ensure a minimum visible radius
+
+    # Format each point straight to JSON text; no per-point dicts or encoder recursion.
+    # repr() gives the shortest round-tripping float, matching what a JSON encoder would emit.
+    points = [
+        f'{{"lat": {lat!r}, "lng": {lng!r}, "alt": 0.005, "radius": {radius!r}, "color": "rgba(255, 255, 0, 0.7)"}}'
+        for lat, lng, radius in zip(latitudes.tolist(), longitudes.tolist(), radii.tolist())
+    ]
+
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     with open(filename, 'w') as f:
-        json.dump(output_data, f)
-    print(f"\nGlobe data exported to {filename} with {len(output_data)} points.")
+        f.write('[' + ', '.join(points) + ']')
+    print(f"\nGlobe data exported to {filename} with {len(points)} points.")
 
 
 if __name__ == "__main__":
@@ -261,11 +326,39 @@ if __name__ == "__main__":
             print(f"Error: Neither '{os.path.basename(csv_path_full)}' nor '{os.path.basename(csv_path_sample)}' found. Place one in the 'docs/data' directory.")
             exit()
         
-        raw_df = pd.read_csv(csv_to_load, low_memory=False, on_bad_lines='skip')
-        print(f"Successfully loaded {len(raw_df)} rows from {os.path.basename(csv_to_load)}")
+        # Reuse the columnar Parquet cache next to the CSV unless the CSV has changed since it was written
+        parquet_cache = os.path.splitext(csv_to_load)[0] + '.parquet'
+        use_cache = os.path.exists(parquet_cache) and os.path.getmtime(parquet_cache) >= os.path.getmtime(csv_to_load)
+        if use_cache:
+            try:
+                # Rebuild the cache if it was written for a different ANALYSIS_COLUMNS projection
+                cache_metadata = pq.read_schema(parquet_cache).metadata or {}
+                if cache_metadata.get(CACHE_COLUMNS_KEY) != ','.join(ANALYSIS_COLUMNS).encode():
+                    print(f"Parquet cache {os.path.basename(parquet_cache)} was built for different columns, re-parsing the CSV")
+                    use_cache = False
+                else:
+                    raw_df = pd.read_parquet(parquet_cache, dtype_backend='pyarrow')
+                    print(f"Successfully loaded {len(raw_df)} rows from cache {os.path.basename(parquet_cache)}")
+            except Exception as e: # Corrupt or truncated cache: fall back to the CSV and rewrite it below
+                print(f"Warning: could not read Parquet cache {parquet_cache}, re-parsing the CSV: {e}")
+                use_cache = False
+        if not use_cache:
+            # Multi-threaded Arrow parse of only the needed columns (comments, city, ... are never parsed).
+            # Header names come from Arrow itself so they match what read_csv expects (e.g. a UTF-8 BOM is stripped).
+            # Free-text comments may hold quoted newlines, which the chunker must be told about
+            parse_options = pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=lambda row: 'skip')
+            with pacsv.open_csv(csv_to_load, parse_options=parse_options) as reader:
+                header = reader.schema.names
+            table = pacsv.read_csv(
+                csv_to_load,
+                parse_options=parse_options,
+                convert_options=pacsv.ConvertOptions(include_columns=[col for col in header if standardize_column_name(col) in LOAD_COLUMNS]),
+            )
+            raw_df = table.to_pandas(types_mapper=pd.ArrowDtype)
+            print(f"Successfully loaded {len(raw_df)} rows from {os.path.basename(csv_to_load)}")
         
         # Standardize column names (idempotent)
-        raw_df.columns = raw_df.columns.str.lower().str.strip().str.replace('[^A-Za-z0-9_]+', '', regex=True)
+        raw_df.columns = [standardize_column_name(col) for col in raw_df.columns]
         
         # Specific renames - check if target doesn't already exist to prevent errors on re-runs
         rename_map = {
@@ -287,6 +380,23 @@ if __name__ == "__main__":
             # If new_name already exists but old_name also does (and isn't new_name), it's ambiguous
             # but we prioritize keeping new_name if it's already correct.
 
+        # Project down to the analysis columns so later copies and filters touch less data
+        raw_df = raw_df[[col for col in ANALYSIS_COLUMNS if col in raw_df.columns]]
+
+        if not use_cache:
+            # Write to a temp file and swap it in, so an interrupted write never leaves a truncated cache behind
+            parquet_tmp = parquet_cache + '.tmp'
+            try:
+                table = pa.Table.from_pandas(raw_df, preserve_index=False)
+                table = table.replace_schema_metadata({**(table.schema.metadata or {}), CACHE_COLUMNS_KEY: ','.join(ANALYSIS_COLUMNS).encode()})
+                pq.write_table(table, parquet_tmp, compression='zstd')
+                os.replace(parquet_tmp, parquet_cache)
+                print(f"Cached {len(raw_df)} rows to {os.path.basename(parquet_cache)} for faster reloads")
+            except Exception as e: # A missing cache only costs speed on the next run
+                print(f"Warning: could not write Parquet cache {parquet_cache}: {e}")
+                with contextlib.suppress(OSError):
+                    os.remove(parquet_tmp)
+
     except FileNotFoundError: # Should be caught by the explicit checks above
         print("Error: CSV file not found despite checks. Ensure a UFO sightings CSV is in the script's directory.")
         exit()
@@ -307,9 +417,8 @@ if __name__ == "__main__":
         print(f"Error: Missing essential columns after loading and initial rename: {missing_cols_after_load}. Available columns: {raw_df.columns.tolist()}")
         exit()
 
-    df = raw_df.copy()
-    print(f"Proceeding with cleaning {len(df)} rows...")
-    df = clean_data(df)
+    print(f"Proceeding with cleaning {len(raw_df)} rows...")
+    df = clean_data(raw_df)
     print(f"Data cleaning complete. {len(df)} rows remaining for analysis.")
 
 
@@ -325,7 +434,7 @@ if __name__ == "__main__":
         # Create empty JSONs to prevent JS errors if frontend expects them
         data_dir = os.path.join(script_dir, '../docs/data')
         os.makedirs(data_dir, exist_ok=True)
-        with open(os.path.join(data_dir, 'eda_summary.json'), 'w') as f: json.dump({}, f)
+        with open(os.path.join(data_dir, 'eda_summary.json'), 'wb') as f: f.write(orjson.dumps({}))
         export_globe_data(df, filename=os.path.join(data_dir, "sightings_for_globe.json")) # Will create empty globe data
         print("Exiting due to empty DataFrame after cleaning.")
         exit()
@@ -337,19 +446,12 @@ if __name__ == "__main__":
     os.makedirs(data_dir, exist_ok=True) # Ensure data directory exists
     
     # Export data for globe
-    export_globe_data(df.copy(), filename=os.path.join(data_dir, "sightings_for_globe.json")) # Pass a copy to be safe
+    export_globe_data(df, filename=os.path.join(data_dir, "sightings_for_globe.json"))
 
     # Export EDA summary
     summary_path = os.path.join(data_dir, 'eda_summary.json')
-    with open(summary_path, 'w') as f:
-        class NpEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, (np.integer, np.int64)): return int(obj)
-                if isinstance(obj, (np.floating, np.float64)): return float(obj) # Handle numpy floats
-                if isinstance(obj, np.ndarray): return obj.tolist()
-                if isinstance(obj, pd.Timestamp): return obj.isoformat()
-                if pd.isna(obj): return None # Handle pandas NaT or NaN directly for numeric fields
-                return super(NpEncoder, self).default(obj)
-        json.dump(eda_summary, f, indent=4, cls=NpEncoder, allow_nan=True) # Allow NaN for graceful nulls
+    with open(summary_path, 'wb') as f:
+        # orjson handles numpy scalars, int keys (year/hour) and writes NaN as null
+        f.write(orjson.dumps(eda_summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
     print(f"\nEDA summary exported to {summary_path}")
     print("\nPython script finished. Open index.html in your browser (preferably via a local server).")
\ No newline at end of file